@@ -0,0 +1,49 @@
+"""
+Lazy import data of `universa`, generated by `universa.utils.freeze_imports`. Do not edit.
+"""
+
+STRUCTURE_KEY = 'bc605c2266a8c3ab'
+
+MODULES = ['agents', 'engine', 'models', 'tools']
+
+ALL_NAMES = ['BaseAgent',
+ 'BaseMessage',
+ 'BaseTool',
+ 'ChatHistory',
+ 'CoreModel',
+ 'OpenAI',
+ 'OpenRouterOpenAI',
+ 'Schema',
+ 'ToolCaller',
+ 'ToolRegistry',
+ 'agent',
+ 'agents',
+ 'chat',
+ 'engine',
+ 'message',
+ 'model',
+ 'models',
+ 'openai',
+ 'openrouter',
+ 'schema',
+ 'tool',
+ 'tools']
+
+CLASS_TO_MODULE = {'BaseAgent': 'agents.agent',
+ 'BaseMessage': 'models.message',
+ 'BaseTool': 'tools.tool',
+ 'ChatHistory': 'agents.chat',
+ 'CoreModel': 'models.model',
+ 'OpenAI': 'models.openai',
+ 'OpenRouterOpenAI': 'models.openrouter',
+ 'Schema': 'engine.schema',
+ 'ToolCaller': 'models.model',
+ 'ToolRegistry': 'tools.tool',
+ 'agent': 'agents',
+ 'chat': 'agents',
+ 'message': 'models',
+ 'model': 'models',
+ 'openai': 'models',
+ 'openrouter': 'models',
+ 'schema': 'engine',
+ 'tool': 'tools'}
@@ -1,8 +1,17 @@
 import json
-import base64
+import functools
 from io import BytesIO
+from types import ModuleType
+from concurrent.futures import ThreadPoolExecutor
 
 from PIL import Image
+from openai.types.chat import ChatCompletion
+
+try:
+    # SIMD accelerated drop-in replacement for base64
+    import pybase64 as base64
+except ImportError:
+    import base64
 
 from .openai import OpenAI
 
@@ -13,10 +22,26 @@ from ..schema import Schema
 from ..utils._types import *
 
 
+@functools.lru_cache(maxsize=None)
+def _import_cv2() -> Optional[Tuple[ModuleType, ModuleType]]:
+    """
+    Import OpenCV, which encodes JPEG with libjpeg-turbo, and numpy on first use.
+    Returns None if they are not installed.
+    """
+    try:
+        import cv2
+        import numpy as np
+    except ImportError:
+        return None
+    return cv2, np
+
+
 class OpenAIVision(OpenAI):
     """
     Basic class for OpenAI vision model.
     """
+    _QUALITIES = frozenset({"auto", "low", "high"})
+
     def __init__(
         self,
         base_url: Optional[str] = None,
@@ -104,7 +129,7 @@ class OpenAIVision(OpenAI):
         Returns:
             str: Quality of the image if fits one of the categories, raises error otherwise.
         """
-        if quality not in ["auto", "low", "high"]:
+        if quality not in self._QUALITIES:
             raise ValueError(" ".join([
                 "The quality of the image can be either 'auto', 'low', 'high'."
             ]))
@@ -122,18 +147,65 @@ class OpenAIVision(OpenAI):
         Returns:
             str: Base64 encoded image.
         """
+        # JPEG has no alpha channel or palette, e.g. RGBA images have to be converted first
+        if image_type != "png" and image.mode not in ("RGB", "L"):
+            image = image.convert("RGB")
+
         with BytesIO() as buffered:
             image.save(buffered, format="PNG" if image_type == "png" else "JPEG")
-            image = base64.b64encode(buffered.getvalue())
-            image = str(image.decode("utf-8"))
+            # Encode straight from the buffer view to avoid copying the image bytes
+            with buffered.getbuffer() as view:
+                data = b"data:image/%s;base64,%s" % (image_type.encode("ascii"), base64.b64encode(view))
+
+        return data.decode("ascii")
+
+    def encode_images(
+            self,
+            images: List[Image.Image],
+            image_type: Literal['jpeg', 'png'],
+            max_side: Optional[int] = None
+    ) -> List[str]:
+        """
+        Encode multiple images to base64. If OpenCV is installed, JPEG images are
+        encoded with it, as it is significantly faster than stock Pillow.
+
+        Args:
+            images (List[Image.Image]): Images to be encoded.
+            image_type (str): Type of the images.
+            max_side (Optional[int]): Maximum size of the longer side of an image.
+                Larger images are downscaled, keeping their aspect ratio.
+
+        Returns:
+            List[str]: Base64 encoded images.
+        """
+        opencv = _import_cv2() if image_type == "jpeg" else None
+
+        encoded = []
+        for image in images:
+            if max_side is not None and max(image.size) > max_side:
+                image = image.copy()
+                image.thumbnail((max_side, max_side))
+
+            if opencv is None:
+                encoded.append(self.encode_image(image, image_type))
+                continue
+
+            cv2, np = opencv
+            array = cv2.cvtColor(np.asarray(image.convert("RGB")), cv2.COLOR_RGB2BGR)
+            success, buffer = cv2.imencode(".jpg", array, [int(cv2.IMWRITE_JPEG_QUALITY), 75])
+            if not success:
+                raise ValueError("Failed to encode the image as JPEG.")
+            data = b"data:image/jpeg;base64," + base64.b64encode(buffer)
+            encoded.append(data.decode("ascii"))
+
+        return encoded
 
-        return f"data:image/{image_type};base64,{image}"
-        
     def create_query(
             self,
             inquiry: str,
             images: Optional[Union[List[str], List[Image.Image]]] = None,
-            image_qualities: Union[str, List[str]] = "auto"
+            image_qualities: Union[str, List[str]] = "auto",
+            image_type: Literal['jpeg', 'png'] = "png"
     ) -> Union[List[Dict[str, Any]], str]:
         """
         Create a message query containing image.
@@ -142,6 +214,7 @@ class OpenAIVision(OpenAI):
             inquiry (str): Inquiry for the image.
             images (List[str] or List[Image.Image]): List of image URLs or base64 encoded strings.
             image_qualities (Union[str, List[str]]): Quality of the images.
+            image_type (str): Type the local images are encoded as, JPEG payloads are considerably smaller.
 
         Returns:
             List[Dict[str, Any]]: Query for the image to text model.
@@ -157,17 +230,24 @@ class OpenAIVision(OpenAI):
 
         image_queries = []
 
+        # Encode all local images at once
+        encoded_images = iter(self.encode_images(
+            [image for image in images if not isinstance(image, str)], image_type
+        ))
+
+        # A single quality is shared by all images, so validate it only once
+        if isinstance(image_qualities, str):
+            image_quality = self._validate_quality(image_qualities)
+
         # For each images validate the quality and create the query
         for i, image_url in enumerate(images):
-            if isinstance(image_qualities, str):
-                image_quality = self._validate_quality(image_qualities)
-            elif isinstance(image_qualities, list):
+            if isinstance(image_qualities, list):
                 image_quality = self._validate_quality(image_qualities[i])
 
             image_queries.append({
                 "type": "image_url",
                 "image_url": {
-                    "url": image_url if isinstance(image_url, str) else self.encode_image(image_url, "png"),
+                    "url": image_url if isinstance(image_url, str) else next(encoded_images),
                     "detail": image_quality
                 }
             })
@@ -179,4 +259,75 @@ class OpenAIVision(OpenAI):
             },
             *image_queries
         ]
-    
\ No newline at end of file
+
+    def create_query_batch(
+            self,
+            inquiries: List[str],
+            image_groups: Optional[List[Optional[Union[List[str], List[Image.Image]]]]] = None,
+            image_qualities: Union[str, List[Union[str, List[str]]]] = "auto",
+            image_type: Literal['jpeg', 'png'] = "png"
+    ) -> List[Union[List[Dict[str, Any]], str]]:
+        """
+        Create message queries for multiple inquiries at once.
+
+        Args:
+            inquiries (List[str]): List of inquiries, one per query.
+            image_groups (Optional[List[List[str] or List[Image.Image]]]): Images for each of the inquiries.
+            image_qualities (Union[str, List[Union[str, List[str]]]]): Quality shared by all the images
+                or qualities for each of the inquiries.
+            image_type (str): Type the local images are encoded as.
+
+        Returns:
+            List[Union[List[Dict[str, Any]], str]]: Queries for the image to text model.
+        """
+        if image_groups is None:
+            image_groups = [None] * len(inquiries)
+
+        if len(image_groups) != len(inquiries):
+            raise ValueError("The number of image groups must match the number of inquiries.")
+
+        if isinstance(image_qualities, list) and len(image_qualities) != len(inquiries):
+            raise ValueError("The number of image qualities must match the number of inquiries.")
+
+        return [
+            self.create_query(
+                inquiry=inquiry,
+                images=images,
+                image_qualities=image_qualities if isinstance(image_qualities, str) else image_qualities[i],
+                image_type=image_type
+            )
+            for i, (inquiry, images) in enumerate(zip(inquiries, image_groups))
+        ]
+
+    def generate_batch(
+            self,
+            queries: List[Union[List[Dict[str, Any]], str]],
+            max_workers: Optional[int] = None,
+            **input_kwargs: Any
+    ) -> List[Union[ChatCompletion, str]]:
+        """
+        Get the responses from the API for multiple queries. Each query is sent as a separate
+        chat completion request, but all of them are dispatched concurrently through the same
+        client, so they share its connection pool.
+
+        Args:
+            queries (List[Union[List[Dict[str, Any]], str]]): Queries created with `create_query` or `create_query_batch`.
+            max_workers (Optional[int]): Maximum number of requests in flight. Defaults to the number of queries,
+                up to 32.
+            input_kwargs (Any): Additional keyword arguments passed to `generate` for every query.
+
+        Returns:
+            List[Union[ChatCompletion, str]]: Responses in the same order as the queries.
+        """
+        if not queries:
+            return []
+
+        messages = [
+            [self.create_message(role="user", content=query)] for query in queries
+        ]
+
+        with ThreadPoolExecutor(max_workers=max_workers or min(32, len(messages))) as executor:
+            return list(executor.map(
+                lambda _messages: self.generate(messages=_messages, **input_kwargs),
+                messages
+            ))
@@ -1,20 +1,35 @@
 import os
 import inspect
+import functools
 from types import ModuleType
+from collections import OrderedDict
 from importlib import import_module
 
 from .utils._types import *
 
 
+@functools.lru_cache(maxsize=None)
 def import_schema(schema_dir: str, schema_name: str) -> ModuleType:
     """
-    Import a schema from a given directory.
+    Import a schema from a given directory. Resolved schemas are cached
+    by their directory and name.
     """
-    _module = import_module("universa")
-    for _parent in ["models", *schema_dir.split("/")]:
-        _module = getattr(_module, _parent)
+    _module = import_module(f"universa.models.{schema_dir.replace('/', '.')}")
     return getattr(_module, schema_name)
 
+# Schemas created with `Schema.create_schema`, keyed by name and field specifications.
+# Least recently used schemas are evicted once the cache is full.
+_SCHEMA_CACHE: "OrderedDict[Tuple[str, Tuple[Any, ...]], Type[Schema]]" = OrderedDict()
+_SCHEMA_CACHE_SIZE = 256
+
+def _spec_repr(spec: Any) -> Any:
+    """
+    Normalize a field specification passed to `Schema.create_schema`.
+    """
+    if isinstance(spec, type):
+        return (spec, ...)
+    return spec
+
 class SchemaValidationError(Exception):
     """
     Raised when the schema validation fails.
@@ -141,15 +156,12 @@ class Schema(BaseModel):
             A string containing the human-readable representation of the schema.
         """
         schema = cls.model_json_schema()
-        _str = f"{schema['title']}:"
+        parts = [f"{schema['title']}:"]
         for k, v in schema["properties"].items():
-            try:
-                _str += f"\n- {k}: {v['type']}"
-            except KeyError:
-                _str += f"\n- {k}: Multiple Types"
+            parts.append(f"\n- {k}: {v.get('type', 'Multiple Types')}")
             if "default" in v:  # because it can be None
-                _str += f" (default: {v['default']})"
-        return _str
+                parts.append(f" (default: {v['default']})")
+        return "".join(parts)
 
     @classmethod
     def _get_kwarg_by_order(cls, order: int = 0) -> Any:
@@ -186,10 +198,36 @@ class Schema(BaseModel):
         """
         # Prepare kwargs
         for k, v in schema_kwargs.items():
-            if isinstance(v, type):
-                schema_kwargs[k] = (v, ...)
-            elif isinstance(v, tuple):
-                schema_kwargs[k] = v
+            schema_kwargs[k] = _spec_repr(v)
+
+        # `FieldInfo` hashes by identity, so specifications containing it never repeat - skip caching
+        if any(
+            isinstance(part, FieldInfo)
+            for v in schema_kwargs.values()
+            for part in (v if isinstance(v, tuple) else (v,))
+        ):
+            return create_model(schema_name, **schema_kwargs, __base__=Schema)
+
+        # Reuse previously created schema of the same shape. Field order is kept
+        # in the key, as it defines the order of the schema properties, and so are
+        # the types of defaults, as e.g. `0 == False` would otherwise collide.
+        cache_key = (schema_name, tuple(
+            (k, v, tuple(map(type, v)) if isinstance(v, tuple) else type(v))
+            for k, v in schema_kwargs.items()
+        ))
+        try:
+            schema = _SCHEMA_CACHE[cache_key]
+            _SCHEMA_CACHE.move_to_end(cache_key)
+            return schema
+        except KeyError:
+            pass
+        except TypeError:
+            # Unhashable field specification (e.g. mutable default) - skip caching
+            return create_model(schema_name, **schema_kwargs, __base__=Schema)
 
         # Create schema
-        return create_model(schema_name, **schema_kwargs, __base__=Schema)
\ No newline at end of file
+        schema = create_model(schema_name, **schema_kwargs, __base__=Schema)
+        _SCHEMA_CACHE[cache_key] = schema
+        if len(_SCHEMA_CACHE) > _SCHEMA_CACHE_SIZE:
+            _SCHEMA_CACHE.popitem(last=False)
+        return schema
\ No newline at end of file
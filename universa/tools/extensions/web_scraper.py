@@ -1,11 +1,29 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from bs4 import BeautifulSoup
 
 from ..tool import ToolRegistry
+from ...utils.execution import ttl_cache
+
+
+# Shared session, so that repeated requests to the same host reuse open connections
+_SESSION = requests.Session()
+_SESSION.headers.update({
+    "User-Agent": "Mozilla/5.0 (compatible; UniversaWebScraper/1.0)",
+})
+_ADAPTER = HTTPAdapter(
+    pool_connections=20,
+    pool_maxsize=50,
+    max_retries=Retry(total=2, backoff_factor=0.3)
+)
+_SESSION.mount("http://", _ADAPTER)
+_SESSION.mount("https://", _ADAPTER)
 
 
 @ToolRegistry.register_tool
+@ttl_cache(maxsize=512, ttl=300)
 def scrap_webpage_content(url: str) -> str:
     """
     Retrieves the contents of a webpage and returns the title and text.
@@ -16,15 +34,18 @@ def scrap_webpage_content(url: str) -> str:
     Returns:
         str: The title and text of the webpage, separated by a newline.
     """
-    webpage = requests.get(url).text
+    response = _SESSION.get(url, timeout=10)
 
-    soup = BeautifulSoup(webpage, "lxml")
+    # Pass raw bytes to the parser, which skips the encoding sniffing done by `response.text`.
+    # The encoding is forced only when the server declares a charset, as requests otherwise
+    # defaults `text/*` responses to ISO-8859-1, overriding the page's own `<meta charset>`.
+    if "charset=" in response.headers.get("Content-Type", "").lower():
+        soup = BeautifulSoup(response.content, "lxml", from_encoding=response.encoding)
+    else:
+        soup = BeautifulSoup(response.content, "lxml")
 
     text = soup.get_text("")
 
-    if soup.title:
-        title = str(soup.title.string)
-    else:
-        title = ""
+    title = soup.title.get_text(strip=True) if soup.title else ""
 
-    return f"{title}\n\n{text}"
+    return f"{title}\n\n{text}" if title else text
@@ -1,20 +1,109 @@
+import re
+import asyncio
+import logging
+import copy
 import inspect
+import textwrap
+import functools
+from types import SimpleNamespace
+from weakref import WeakKeyDictionary, WeakValueDictionary
+from concurrent.futures import ThreadPoolExecutor
 
 from docstring_parser import parse, compose, common
 from docstring_parser.common import DocstringStyle
 
 from ..core import Executable
 
-from ..schema import Schema
+from ..schema import Schema, SchemaValidationError
 from .tool_schema import ToolCall, ToolCallResult
 
-from ..utils.registry import Registry
+from ..utils.registry import Registry, ItemNotFound
 from ..utils.logs import get_logger
-from ..utils._types import *
+from ..utils._types_core import (
+    List,
+    Dict,
+    Optional,
+    Callable,
+    Any,
+    Type,
+    Tuple,
+    TypeVar,
+    Iterable,
+    Literal,
+    ForwardRef,
+    Self,
+)
+from typing import Set, get_type_hints
+from pydantic import ValidationError
+from pydantic.fields import FieldInfo
+from pydantic.json_schema import JsonSchemaValue
+from pydantic_core import PydanticUndefined
 
 
 logger = get_logger(__name__)
 
+# BaseTool instances created with `BaseTool.from_function`, keyed by the wrapped function.
+# The function itself is used as the key (not its code object), as closures created from
+# the same code can differ in captured variables.
+_TOOL_CACHE: "WeakValueDictionary[Callable[..., Any], BaseTool]" = WeakValueDictionary()
+
+
+# Section titles recognized by the Google Style parser of `docstring_parser`
+_GOOGLE_SECTION_RE = re.compile(
+    r"^(Arguments|Args|Parameters|Params|Raises|Exceptions|Except|Attributes|Example|Examples|Returns|Yields):[ \t\r]*$",
+    re.M
+)
+_ARGS_SECTIONS = ("Arguments", "Args", "Parameters", "Params")
+# Sections the fast path handles, any other one is left to `docstring_parser`
+_FAST_SECTIONS = frozenset(_ARGS_SECTIONS + ("Returns", "Yields", "Raises", "Exceptions", "Except", "Example", "Examples"))
+# `name (type): description` or `name: description`
+_PARAM_RE = re.compile(r"^(\*{0,2}\w+)\s*(?:\([^)]*\))?\s*:\s*(.*)$")
+# Leading return type, e.g. `bool: description` or `Dict[str, Any]: description`
+_RETURN_TYPE_RE = re.compile(r"^(?:[^:\s]+|[^:]*\]):\s*")
+
+# Types of inputs that can be passed to tools compiled with numba
+_NUMERIC_TYPES = (int, float, bool)
+
+# Forward references of string annotations, shared between tools
+_FORWARD_REF_CACHE: Dict[str, ForwardRef] = {}
+
+
+def _is_numba_error(error: Exception) -> bool:
+    """
+    Check if the error was raised by numba itself, e.g. when compiling a function, as opposed
+    to an error raised by the code of the compiled function.
+    """
+    try:
+        from numba.core.errors import NumbaError
+    except ImportError:
+        return False
+    return isinstance(error, NumbaError)
+
+
+def _run_coroutines(coroutines: List[Any]) -> List[Any]:
+    """
+    Run the coroutines concurrently and return their results in order.
+    """
+    async def _gather() -> List[Any]:
+        return await asyncio.gather(*coroutines)
+
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(_gather())
+
+    # Event loop is already running in this thread - run in a separate one to avoid blocking it
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, _gather()).result()
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_docstring(doc: str) -> common.Docstring:
+    """
+    Parse a Google Style docstring. Functions sharing the same docstring are parsed only once.
+    """
+    return parse(doc, style=DocstringStyle.GOOGLE)
+
 
 class MissingAnnotationError(Exception):
     """
@@ -57,6 +146,8 @@ class Docstring:
     A class to represent the docstring of a function.
     This class stores several information from the Google Style docstring of a function.
     """
+    _NL_TABLE = str.maketrans({"\n": " ", "\r": " ", "\t": " "})
+
     def __init__(
         self,
         func: Callable[..., Any],
@@ -70,13 +161,14 @@ class Docstring:
         self.args = args
         self.returns_desc = returns_desc
         self.from_docstring_parser = from_docstring_parser
+        self._rendered: Optional[str] = None
 
-    @staticmethod
-    def remove_new_lines(text: str) -> str:
+    @classmethod
+    def remove_new_lines(cls, text: str) -> str:
         """
-        Remove new lines from the description.
+        Remove new lines (including carriage returns and tabs) from the description.
         """
-        return text.replace("\n", " ").strip()
+        return text.translate(cls._NL_TABLE).strip()
 
     @classmethod
     def extract_description(
@@ -90,7 +182,8 @@ class Docstring:
         description = parsed_docstring.description
         if description is None or len(description) == 0:
             logger.warning(
-                f"Incorrect docstring format. Function '{func.__name__}' is missing return value description."
+                "Incorrect docstring format. Function '%s' is missing return value description.",
+                func.__name__
             )
             description = func.__name__.replace("_", " ")
         else:
@@ -110,7 +203,8 @@ class Docstring:
         """
         if len(parsed_docstring.params) == 0:
             logger.warning(
-                f"Incorrect docstring format. Function '{func.__name__}' is missing parameter descriptions. Each parameter descriptions will be in Parameter '<param_name>' format."
+                "Incorrect docstring format. Function '%s' is missing parameter descriptions. Each parameter descriptions will be in Parameter '<param_name>' format.",
+                func.__name__
             )
 
         args = {
@@ -133,13 +227,60 @@ class Docstring:
         returns = parsed_docstring.returns
         if returns is None or returns.description is None or returns.description == "":
             logger.warning(
-                f"Incorrect docstring format. Function '{func.__name__}' is missing return value description."
+                "Incorrect docstring format. Function '%s' is missing return value description.",
+                func.__name__
             )
             returns_desc = "The return value."
         else:
             returns_desc = cls.remove_new_lines(returns.description)
         return returns_desc
 
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _fast_parse(doc: str) -> Optional[SimpleNamespace]:
+        """
+        Parse a Google Style docstring in a single pass. The result mimics the attributes
+        of `docstring_parser` output that are used for extraction, i.e. `description`,
+        `params` and `returns`.
+
+        Returns None if the docstring can not be handled by the fast path.
+        """
+        # Normalize the line endings, e.g. `\r\n`, before splitting into sections
+        parts = _GOOGLE_SECTION_RE.split(inspect.cleandoc("\n".join(doc.splitlines())))
+        description = parts[0].strip()
+        sections = dict(zip(parts[1::2], parts[2::2]))
+        if not sections.keys() <= _FAST_SECTIONS:
+            return None
+
+        # Each parameter starts at the indentation of the block, continuation lines are indented further
+        params = []
+        args_block = next((sections[title] for title in _ARGS_SECTIONS if title in sections), None)
+        if args_block is not None:
+            for line in textwrap.dedent(args_block).splitlines():
+                if not line.strip():
+                    continue
+                if line[0].isspace():
+                    if not params:
+                        return None
+                    params[-1].description += "\n" + line.strip()
+                    continue
+                match = _PARAM_RE.match(line)
+                if match is None:
+                    return None
+                params.append(SimpleNamespace(arg_name=match.group(1), description=match.group(2)))
+
+            if not params:
+                return None
+
+        returns = None
+        # Generators document their values under `Yields`, `docstring_parser` reports them as returns
+        returns_block = (sections.get("Returns") or sections.get("Yields") or "").strip()
+        if returns_block:
+            returns_desc = "\n".join(line.strip() for line in returns_block.splitlines())
+            returns = SimpleNamespace(description=_RETURN_TYPE_RE.sub("", returns_desc, count=1))
+
+        return SimpleNamespace(description=description, params=params, returns=returns)
+
     @classmethod
     def from_function(cls, func: Callable[..., Any]) -> Self:
         """
@@ -176,18 +317,22 @@ class Docstring:
             >>> print(docstring.returns)
             The result of the function.
         """
-        try:
-            _doc = func.__doc__
-            if _doc is not None:
-                parsed_docstring = parse(_doc, style=DocstringStyle.GOOGLE)
-        except Exception as e:
-            raise DocstringParseError(issues=e.args)
+        _doc = func.__doc__ or ""
+
+        # Full `docstring_parser` object is only created when the fast path fails
+        from_docstring_parser = None
+        parsed_docstring = cls._fast_parse(_doc)
+        if parsed_docstring is None:
+            try:
+                parsed_docstring = from_docstring_parser = _parse_docstring(_doc)
+            except Exception as e:
+                raise DocstringParseError(issues=e.args)
 
         description = cls.extract_description(parsed_docstring, func)
         args = cls.extract_params(parsed_docstring, func)
         returns_desc = cls.extract_returns(parsed_docstring, func)
 
-        return cls(func, description, args, returns_desc, parsed_docstring)
+        return cls(func, description, args, returns_desc, from_docstring_parser)
 
     def get_function_description(self) -> str:
         """
@@ -210,16 +355,20 @@ class Docstring:
         """
 
         if self.args is None:
-            logger.warning(
-                f"Incorrect docstring format. Function '{self.func.__name__}' is missing parameter description for '{param_name}'."
-            )
+            if logger.isEnabledFor(logging.WARNING):
+                logger.warning(
+                    "Incorrect docstring format. Function '%s' is missing parameter description for '%s'.",
+                    self.func.__name__, param_name
+                )
             return f"Parameter '{param_name}'"
         
         param_desc = self.args.get(param_name, None)
         if param_desc is None or len(param_desc) == 0:
-            logger.warning(
-                f"Incorrect docstring format. Function '{self.func.__name__}' is missing parameter description for '{param_name}'."
-            )
+            if logger.isEnabledFor(logging.WARNING):
+                logger.warning(
+                    "Incorrect docstring format. Function '%s' is missing parameter description for '%s'.",
+                    self.func.__name__, param_name
+                )
             return f"Parameter '{param_name}'"
 
         return param_desc
@@ -234,13 +383,21 @@ class Docstring:
         return self.returns_desc
 
     def __str__(self):
+        # Docstring does not change, so it is rendered only once
+        if self._rendered is not None:
+            return self._rendered
+
+        if self.from_docstring_parser is None and self.func.__doc__:
+            self.from_docstring_parser = _parse_docstring(self.func.__doc__)
+
         if self.from_docstring_parser is not None:
-            return compose(
+            self._rendered = compose(
                 docstring=self.from_docstring_parser,
                 style=DocstringStyle.GOOGLE,
             )
         else:
-            return ""
+            self._rendered = ""
+        return self._rendered
 
 class BaseTool(Executable):
     """
@@ -254,6 +411,7 @@ class BaseTool(Executable):
         func: Callable[..., Any],
         input_schema: Type[Schema],
         output_schema: Type[Schema],
+        compiled_func: Optional[Callable[..., Any]] = None,
     ) -> None:
         """
         Initialize function.
@@ -264,6 +422,30 @@ class BaseTool(Executable):
         self.func = func
         self.input_schema = input_schema
         self.output_schema = output_schema
+        # Natively compiled version of the function, called positionally with numeric inputs only
+        self.compiled_func = compiled_func
+
+        # Schemas of the tool created by schema producing functions, see `get_schema`
+        self._schema_cache: "WeakKeyDictionary[Callable[[BaseTool], JsonSchemaValue], JsonSchemaValue]" = WeakKeyDictionary()
+
+    def get_schema(self, func: Callable[["BaseTool"], JsonSchemaValue]) -> JsonSchemaValue:
+        """
+        Create the JSON schema of the tool with the given function, e.g. `OpenAI.get_function_schema`.
+        The tool does not change after creation, so the schema is created only once per function.
+
+        Args:
+            func (Callable[[BaseTool], JsonSchemaValue]): Function creating the schema of the tool.
+
+        Returns:
+            JsonSchemaValue: The JSON schema of the tool.
+        """
+        try:
+            return self._schema_cache[func]
+        except KeyError:
+            schema = self._schema_cache[func] = func(self)
+            return schema
+        except TypeError:  # not weak referenceable
+            return func(self)
 
     @staticmethod
     def get_verified_annotation(annotation: Any) -> Any:
@@ -276,38 +458,89 @@ class BaseTool(Executable):
             Any: The type annotation of the parameter.
         """
         if isinstance(annotation, str):
-            return ForwardRef(annotation)
-        if annotation.__name__ == "Callable":
+            ref = _FORWARD_REF_CACHE.get(annotation)
+            if ref is None:
+                ref = _FORWARD_REF_CACHE[annotation] = ForwardRef(annotation)
+            return ref
+        try:
+            name = annotation.__name__
+        except AttributeError:  # e.g. some typing generics
+            return annotation
+        if name == "Callable":
             raise ValueError(
                 "Callable type annotations are not supported. Please use a more specific type."
             )
         else:
             return annotation
 
+    @staticmethod
+    def _fast_signature(
+        func: Callable[..., Any],
+    ) -> Tuple[List[str], Dict[str, Any], Dict[str, Any], Any]:
+        """
+        Retrieve the parameter names, annotations, defaults and return annotation of a function.
+        Plain Python functions are read directly from their code object, which is much cheaper
+        than building `inspect.Signature`. Other callables fall back to `inspect.signature`.
+
+        Args:
+            func (Callable[..., Any]): The function to inspect.
+
+        Returns:
+            Tuple[List[str], Dict[str, Any], Dict[str, Any], Any]: Parameter names, annotations by name
+                (missing for unannotated parameters), defaults by name and the return annotation
+                (`inspect.Signature.empty` if missing).
+        """
+        func = inspect.unwrap(func)
+        code = getattr(func, "__code__", None)
+        if (
+            not inspect.isfunction(func)
+            or hasattr(func, "__signature__")
+            or code.co_flags & (inspect.CO_VARARGS | inspect.CO_VARKEYWORDS)
+        ):
+            func_spec = inspect.signature(func)
+            params = func_spec.parameters.values()
+            return (
+                [p.name for p in params],
+                {p.name: p.annotation for p in params if p.annotation is not inspect.Parameter.empty},
+                {p.name: p.default for p in params if p.default is not inspect.Parameter.empty},
+                func_spec.return_annotation,
+            )
+
+        names = list(code.co_varnames[:code.co_argcount + code.co_kwonlyargcount])
+        annotations = func.__annotations__
+        defaults = dict(func.__kwdefaults__ or {})
+        if func.__defaults__:
+            positional = names[:code.co_argcount]
+            defaults.update(zip(positional[-len(func.__defaults__):], func.__defaults__))
+
+        return (
+            names,
+            {name: annotations[name] for name in names if name in annotations},
+            defaults,
+            annotations.get("return", inspect.Signature.empty),
+        )
+
     @staticmethod
     def get_param_info(
-        param: inspect.Parameter,
+        name: str,
+        annotation: Any,
+        default: Any,
         docstring: Docstring,
     ) -> Tuple[Any, FieldInfo]:
         
         # Get the verified annotation. Checks for Callable type and Forward References
-        param_annotation = BaseTool.get_verified_annotation(param.annotation)
-        default = (
-            PydanticUndefined
-            if param.default is inspect.Parameter.empty
-            else param.default
-        )
+        param_annotation = BaseTool.get_verified_annotation(annotation)
 
         # Get the description of the parameter
         if hasattr(param_annotation, "__metadata__"):
             if not isinstance(param_annotation.__metadata__[0], str):
                 raise ValueError(
-                    f"Description of parameter:'{param.name}' must be a string."
+                    f"Description of parameter:'{name}' must be a string."
                 )
             description = param_annotation.__metadata__[0]
         else:
             # If the description is not provided in the annotation, extract it from the docstring
-            description = docstring.get_param_description(param.name)
+            description = docstring.get_param_description(name)
         return param_annotation, FieldInfo(default=default, description=description)
 
     @classmethod
@@ -329,26 +562,45 @@ class BaseTool(Executable):
         """
         assert isinstance(func, Callable), "Input must be a callable."
 
+        # Return the already created tool for this function
+        try:
+            cached = _TOOL_CACHE.get(func)
+        except TypeError:  # unhashable callable
+            cached = None
+        if isinstance(cached, cls):
+            return cached
+
         docstring = Docstring.from_function(func)
         func_args = {}
-        func_spec = inspect.signature(func)
-        for _, v in func_spec.parameters.items():
+        names, annotations, defaults, return_type = BaseTool._fast_signature(func)
+
+        # Resolve forward references against the function's own namespace in one pass.
+        # If some of them can not be resolved, the annotations are used as they are.
+        try:
+            hints = get_type_hints(func, include_extras=True)
+        except Exception:
+            hints = {}
+        if hints:
+            annotations = {name: hints.get(name, annotation) for name, annotation in annotations.items()}
+            return_type = hints.get("return", return_type)
+        for name in names:
             # Throw an error if the parameter is missing annotations
-            if v.annotation is inspect.Parameter.empty:
-                raise MissingAnnotationError([v.name])
+            if name not in annotations:
+                raise MissingAnnotationError([name])
 
-            annotation, field_info = BaseTool.get_param_info(v, docstring)
-            func_args[v.name] = (annotation, field_info)
+            func_args[name] = BaseTool.get_param_info(
+                name, annotations[name], defaults.get(name, PydanticUndefined), docstring
+            )
 
         input_schema = Schema.create_schema(
             func.__name__ + "_input_schema", **func_args
         )
 
-        return_type = func_spec.return_annotation
-        if return_type is inspect.Signature.empty or return_type is None:
+        if return_type is inspect.Signature.empty or return_type is None or return_type is type(None):
             logger.warning(
-                f"Function {func.__name__} is missing a proper return type annotation."
-                " Although it is not required, it is recommended to add an appropriate one."
+                "Function %s is missing a proper return type annotation."
+                " Although it is not required, it is recommended to add an appropriate one.",
+                func.__name__
             )
             return_type = Any
 
@@ -356,7 +608,7 @@ class BaseTool(Executable):
             func.__name__ + "_output_schema", output=(return_type, ...)
         )
 
-        return cls(
+        tool = cls(
             name=func.__name__,
             description=docstring.get_function_description(),
             docstring=docstring,
@@ -365,16 +617,38 @@ class BaseTool(Executable):
             output_schema=output_schema,
         )
 
+        try:
+            _TOOL_CACHE[func] = tool
+        except TypeError:  # unhashable callable
+            pass
+
+        return tool
+
     @staticmethod
     def execute_tool(
         tool_call_infos: List[ToolCall],
         tool_registry: "ToolRegistry",
+        *,
+        parallel: bool = True,
+        validate: bool = True,
     ) -> Dict[str, ToolCallResult]:
         """
         Executes the function with the given arguments and keyword arguments.
         Input type has to satisfy the input_schema and the return type is output_schema.
+
+        All tool calls are validated before any of them is executed. By default, independent
+        tool calls run concurrently - synchronous tools in a thread pool and coroutine tools
+        on an event loop. Set `parallel` to False to execute them one by one, in order.
+
+        Validation can be skipped with `validate=False` when the arguments are trusted, e.g. they
+        were produced by a model constrained by the tool's JSON schema. The arguments are then
+        passed to the tool as they are, without conversion or defaults applied by the schema.
         """
-        results: Dict[str, ToolCallResult] = {}
+        calls: List[Tuple[str, str, BaseTool, Dict[str, Any]]] = []
+
+        # Tools already retrieved from the registry, as several calls often target the same tool
+        _lookup = tool_registry.get_tool
+        seen: Dict[str, Optional[BaseTool]] = {}
 
         for tool_call_info in tool_call_infos:
 
@@ -383,7 +657,9 @@ class BaseTool(Executable):
             function_args = tool_call_info.function_params
 
             # Get the function from the tool registry
-            function = tool_registry.get_tool(function_name)
+            function = seen.get(function_name)
+            if function is None:
+                function = seen[function_name] = _lookup(function_name)
 
             if not isinstance(function, BaseTool):
                 raise ValueError(
@@ -391,18 +667,91 @@ class BaseTool(Executable):
                 )
 
             # Create input schema to validate whether input format is correct
-            input = function.input_schema.validate(function_args, to_dict=True)
-
-            # Execute the function
-            logger.info(f"Executing function: {function_name} with input: {input}")
-            if isinstance(input, dict):
-                execution_result = function.func(**input)
+            if validate:
+                try:
+                    input = function.input_schema.model_validate(function_args).model_dump()
+                except ValidationError as e:
+                    raise SchemaValidationError.from_pydantic(e)
+            else:
+                input = function_args
 
-            # Store the result
             id = tool_call_info.get_tool_call_id()
+            calls.append((id, function_name, function, input))
+
+        def _execute(call: Tuple[str, str, BaseTool, Dict[str, Any]]) -> Any:
+            _, function_name, function, input = call
+            logger.info("Executing function: %s with input: %s", function_name, input)
+
+            # Use the compiled entry point if all the inputs are plain numbers
+            fields = function.input_schema.model_fields
+            if (
+                function.compiled_func is not None
+                and input.keys() == fields.keys()
+                and all(type(value) in _NUMERIC_TYPES for value in input.values())
+            ):
+                compiled_func = function.compiled_func
+                try:
+                    return compiled_func(*[input[name] for name in fields])
+                except Exception as e:
+                    if not _is_numba_error(e):
+                        raise
+                    # Compilation happens on the first call - fall back to the Python function for good
+                    logger.warning(
+                        "Tool: '%s' could not be compiled with numba, it will be executed without compilation: %s",
+                        function_name, e
+                    )
+                    if function.compiled_func is compiled_func:
+                        function.compiled_func = None
+
+            return function.func(**input)
+
+        # Execute the functions
+        execution_results: Dict[str, Any] = {}
+        if not parallel:
+            for call in calls:
+                execution_result = _execute(call)
+                if inspect.isawaitable(execution_result):
+                    execution_result = _run_coroutines([execution_result])[0]
+                execution_results[call[0]] = execution_result
+        else:
+            # Coroutine tools are gathered on an event loop in the background,
+            # while the synchronous tools run in the thread pool
+            async_calls = [call for call in calls if asyncio.iscoroutinefunction(call[2].func)]
+            sync_calls = [call for call in calls if not asyncio.iscoroutinefunction(call[2].func)]
+
+            async_results = None
+            if len(sync_calls) > 1 or (sync_calls and async_calls):
+                with ThreadPoolExecutor(max_workers=min(32, len(sync_calls)) + bool(async_calls)) as executor:
+                    if async_calls:
+                        async_results = executor.submit(
+                            _run_coroutines, [_execute(call) for call in async_calls]
+                        )
+                    execution_results.update(zip(
+                        [call[0] for call in sync_calls],
+                        executor.map(_execute, sync_calls)
+                    ))
+            elif sync_calls:
+                execution_results[sync_calls[0][0]] = _execute(sync_calls[0])
+            else:
+                execution_results.update(zip(
+                    [call[0] for call in async_calls],
+                    _run_coroutines([_execute(call) for call in async_calls])
+                ))
+
+            if async_results is not None:
+                execution_results.update(zip([call[0] for call in async_calls], async_results.result()))
+
+            # Synchronous tools may still return awaitables, e.g. wrappers of coroutine functions
+            awaitables = {id: result for id, result in execution_results.items() if inspect.isawaitable(result)}
+            if awaitables:
+                execution_results.update(zip(awaitables.keys(), _run_coroutines(list(awaitables.values()))))
+
+        # Store the results in the order of the tool calls
+        results: Dict[str, ToolCallResult] = {}
+        for id, function_name, _, _ in calls:
             results[id] = ToolCallResult(
                 function_name=function_name,
-                result=execution_result,
+                result=execution_results[id],
             )
 
         return results
@@ -417,6 +766,11 @@ class BaseTool(Executable):
         Returns:
             str: A string representation of the object.
         """
+        # Tool does not change after creation, so the representation is built only once
+        _cached_str = getattr(self, "_cached_str", None)
+        if _cached_str is not None:
+            return _cached_str
+
         _doc = getattr(self, "_doc", self.__doc__)
         _name = getattr(self, "_name", self.__class__.__name__)
         _json_schema = getattr(self, "input_schema", None)
@@ -426,6 +780,7 @@ class BaseTool(Executable):
         if _json_schema:
             _str += f"\n{_json_schema.to_str()}"  # requires schema to by of type Schema, not BaseModel
 
+        self._cached_str = _str
         return _str
 
 class ToolRegistry(Registry):
@@ -434,7 +789,12 @@ class ToolRegistry(Registry):
     so that we could simply choose the methods from here.
     """
     # Contains all the tools/methods by key value pair where the key is the name of the module where it is stored.
-    registered_tools: Dict[str, BaseTool] = {}
+    # References are weak, tools are kept alive by `_pinned` until they are removed.
+    registered_tools: "WeakValueDictionary[str, BaseTool]" = WeakValueDictionary()
+    # Same tools keyed by the tool (function) name, for direct lookups by name.
+    _by_name: "WeakValueDictionary[str, BaseTool]" = WeakValueDictionary()
+    # Strong references to the registered tools.
+    _pinned: Set[BaseTool] = set()
 
     T = TypeVar("T")
 
@@ -442,31 +802,94 @@ class ToolRegistry(Registry):
         self,
         available_tools: Optional[Dict[str, BaseTool]] = None,
     ) -> None:
+        super().__init__()
         self.available_tools = available_tools if available_tools else {}
 
+    @property
+    def available_tools(self) -> Dict[str, BaseTool]:
+        """
+        Tools of this registry instance by their names, stored as the registry items.
+        """
+        return self.registry
+
+    @available_tools.setter
+    def available_tools(self, tools: Dict[str, BaseTool]) -> None:
+        self.registry = tools
+
     @classmethod
-    def register_tool(cls, func: Callable[..., T]) -> Callable[..., T]:
+    def register_tool(
+        cls,
+        func: Optional[Callable[..., T]] = None,
+        *,
+        compile: Optional[Literal["numba"]] = None,
+    ) -> Callable[..., T]:
         """
         Registers a tool function in the tool registry - to be used as a decorator.
         The keys in the registry are the module addresses where the tool functions are stored.
         And the values are the BaseTool instances of the tool functions.
 
+        Purely numeric tools (all parameters annotated as `int`, `float` or `bool`) can be
+        compiled with numba by using `@ToolRegistry.register_tool(compile="numba")`. The compiled
+        version is used whenever all the inputs of a tool call are plain numbers.
+
         Args:
             func: The tool function to be registered.
+            compile: Compiler used to create a native version of the tool function.
 
         Returns:
             The registered tool function.
         """
-        if func.__module__ in cls.registered_tools:
+        if func is None:
+            return functools.partial(cls.register_tool, compile=compile)
+
+        func_obj = BaseTool.from_function(func)
+        if compile == "numba":
+            # Tools are shared through the tool cache, so the compiled entry point is set on a copy
+            func_obj = copy.copy(func_obj)
+            func_obj.compiled_func = cls._compile_numba(func_obj)
+        elif compile is not None:
+            raise ToolRegistrationError(f"Unsupported compiler: '{compile}'.")
+
+        # Tools are looked up by their names as well, so the names have to be unique too
+        registered = cls._by_name.get(func_obj.name)
+        if registered is not None and registered is not func_obj:
             raise ToolRegistrationError(
-                f"Module: '{func.__module__}' for the tool: '{func.__name__}' already exists. Use a different name for the module. "
+                f"Tool with the name: '{func_obj.name}' is already registered from the module: "
+                f"'{registered.func.__module__}'. Use a different name for the tool."
             )
 
-        func_obj = BaseTool.from_function(func)
-        cls.registered_tools[func.__module__] = func_obj
+        if cls.registered_tools.setdefault(func.__module__, func_obj) is not func_obj:
+            raise ToolRegistrationError(
+                f"Module: '{func.__module__}' for the tool: '{func.__name__}' already exists. Use a different name for the module. "
+            )
+        cls._by_name[func_obj.name] = func_obj
+        cls._pinned.add(func_obj)
 
         return func
 
+    @staticmethod
+    def _compile_numba(tool: BaseTool) -> Optional[Callable[..., Any]]:
+        """
+        Compile the function of a purely numeric tool with numba. Compilation itself happens
+        lazily, on the first call of the compiled function.
+        """
+        fields = tool.input_schema.model_fields
+        non_numeric = [name for name, field in fields.items() if field.annotation not in _NUMERIC_TYPES]
+        if non_numeric:
+            raise ToolRegistrationError(
+                f"Tool: '{tool.name}' can not be compiled, parameters {non_numeric} are not numeric."
+            )
+
+        try:
+            from numba import njit
+        except ImportError:
+            logger.warning(
+                "numba is not installed - tool: '%s' will be executed without compilation.", tool.name
+            )
+            return None
+
+        return njit(tool.func)
+
     def add_tool(self, func: Callable[..., Any]) -> None:
         """
         Method for adding tool instead of the register_tool decorator.
@@ -479,7 +902,7 @@ class ToolRegistry(Registry):
         None
         """
         func_obj = BaseTool.from_function(func)
-        self.registry["tools"][func_obj.name] = func_obj
+        self.available_tools[func_obj.name] = func_obj
 
     def get_tool(self, tool_name) -> Optional[BaseTool]:
         """
@@ -503,19 +926,48 @@ class ToolRegistry(Registry):
         Returns:
             A list of JsonSchemaValue objects representing the available tools in the registry.
         """
-        return [func(tool) for tool in self.available_tools.values()]
+        return [tool.get_schema(func) for tool in self.available_tools.values()]
 
-    def remove_tool(self, tool_name) -> JsonSchemaValue:
+    def remove_tool(self, tool_name) -> BaseTool:
         """
-        Remove a tool from the registry.
+        Remove a tool from this registry instance. The tool stays registered,
+        see `unregister_tool` for removing it from all the registered tools.
 
         Args:
             tool_name (str): The name of the tool to be removed.
 
         Returns:
-            JsonSchemaValue: The removed tool.
+            BaseTool: The removed tool.
+        """
+        return self.available_tools.pop(tool_name)
+
+    @classmethod
+    def unregister_tool(cls, tool_name: str) -> BaseTool:
+        """
+        Remove a tool from the registered tools. The tool is no longer kept alive by the registry
+        and is dropped once nothing else, e.g. a registry instance, references it.
+
+        Args:
+            tool_name (str): The name or the module address of the tool to be unregistered.
+
+        Returns:
+            BaseTool: The unregistered tool.
+
+        Raises:
+            ItemNotFound: If the tool is not registered.
         """
-        return self.registry.pop(tool_name)
+        tool = cls._by_name.get(tool_name) or cls.registered_tools.get(tool_name)
+        if tool is None:
+            raise ItemNotFound(tool_name)
+
+        for module, registered in list(cls.registered_tools.items()):
+            if registered is tool:
+                del cls.registered_tools[module]
+        if cls._by_name.get(tool.name) is tool:
+            del cls._by_name[tool.name]
+        cls._pinned.discard(tool)
+
+        return tool
 
     @classmethod
     def from_tool_names(cls, tool_names: List[str]) -> Self:
@@ -524,25 +976,33 @@ class ToolRegistry(Registry):
 
         Args:
             tool_names (Optional[List[str]]): A list of tool names to include in the new ToolRegistry instance.
+                Both the tool names and the module addresses of the tools are accepted.
 
         Returns:
             ToolRegistry: A new instance of ToolRegistry containing only the specified tools.
         """
-        filtered_tools: Dict[str, BaseTool] = {}
+        # Tools are available both by their module addresses and names
+        registered = dict(cls.registered_tools)
+        registered.update(cls._by_name)
 
-        for tool_name in tool_names:
-            if tool_name in cls.registered_tools:
-                tool = cls.registered_tools[tool_name]
-                if tool.name in filtered_tools:
-                    raise ToolRegistrationError(
-                        f"Tool with the name: '{tool.name}' already exists in the registry."
-                        " Use a different name for the tool."
-                    )
-                filtered_tools[tool.name] = tool
-            else:
-                logger.warning(
-                    f"WARNING: Tool: {tool_name} is not available in the registry."
-                )
+        wanted = dict.fromkeys(tool_names)  # keeps the requested order
+        found = wanted.keys() & registered.keys()
+        for tool_name in wanted.keys() - found:
+            logger.warning(
+                "WARNING: Tool: %s is not available in the registry.",
+                tool_name
+            )
+
+        tools = [registered[tool_name] for tool_name in wanted if tool_name in found]
+        filtered_tools: Dict[str, BaseTool] = {tool.name: tool for tool in tools}
+
+        # Different tools requested under the same name
+        if len(filtered_tools) != len({id(tool) for tool in tools}):
+            duplicates = {tool.name for tool in tools if filtered_tools[tool.name] is not tool}
+            raise ToolRegistrationError(
+                f"Tool with the name: '{', '.join(sorted(duplicates))}' already exists in the registry."
+                " Use a different name for the tool."
+            )
 
         return cls(available_tools=filtered_tools)
 
@@ -555,5 +1015,4 @@ class ToolRegistry(Registry):
             A list of BaseTool objects representing the available tools in the registry.
         """
 
-        return cls.registered_tools
-    
\ No newline at end of file
+        return dict(cls.registered_tools)
@@ -0,0 +1,27 @@
+import sys
+
+if sys.version_info[1] >= 11:
+     from typing import Self # type: ignore
+else:
+     from typing_extensions import Self
+
+from typing import (
+    Any,
+    List,
+    Tuple,
+    Dict,
+    Type,
+    Union,
+    Literal,
+    Optional,
+    Callable,
+    ForwardRef,
+    TypeVar,
+    Mapping,
+    Iterable,
+    Annotated,
+)
+
+# Serialization
+SerializedType = Dict[str, Any]
+DeserializableType = Union[str, Dict[str, Any]]
@@ -0,0 +1,14 @@
+from pydantic import (
+     BaseModel,
+     TypeAdapter,
+     ConfigDict,
+     Field,
+     create_model,
+     field_validator,
+     SkipValidation,
+     SerializeAsAny,
+     ValidationError,
+)
+from pydantic.fields import FieldInfo
+from pydantic.json_schema import JsonSchemaValue
+from pydantic_core import PydanticUndefined
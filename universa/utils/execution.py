@@ -1,9 +1,19 @@
 import re
+import time
+import inspect
 import functools
-from typing import Any, Callable, Union, Tuple
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional, Union, Tuple, TYPE_CHECKING
 
 from .logs import general_logger
 
+if TYPE_CHECKING:
+    import numpy as np
+
+# Extracts the name of the invalid argument from `TypeError` messages
+_EXTRACT_KW = re.compile(r"keyword argument '([^']+)'")
+
 
 def retry(num_retries: int = 2):
     """
@@ -40,6 +50,63 @@ def retry(num_retries: int = 2):
         return wrapper
     return decorator
 
+def ttl_cache(maxsize: int = 128, ttl: float = 300):
+    """
+    Thread-safe LRU caching decorator, whose entries expire after `ttl` seconds.
+    Concurrent calls with the same arguments wait for the first one to finish
+    instead of computing the same result again.
+
+    Args:
+        maxsize (int): Maximum number of cached results.
+        ttl (float): Number of seconds after which a cached result expires.
+
+    Returns:
+        Any: Any return value of the decorated function.
+    """
+    def decorator(func: Callable):
+        cache: OrderedDict = OrderedDict()
+        key_locks: Dict[Hashable, threading.Lock] = {}
+        lock = threading.Lock()
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs) -> Any:
+            key = (args, tuple(sorted(kwargs.items())))
+            with lock:
+                key_lock = key_locks.setdefault(key, threading.Lock())
+
+            with key_lock:
+                with lock:
+                    cached = cache.get(key)
+                    if cached is not None and cached[0] > time.monotonic():
+                        cache.move_to_end(key)
+                        return cached[1]
+
+                try:
+                    result = func(*args, **kwargs)
+                except Exception:
+                    with lock:
+                        if key not in cache:
+                            key_locks.pop(key, None)
+                    raise
+
+                with lock:
+                    cache[key] = (time.monotonic() + ttl, result)
+                    cache.move_to_end(key)
+                    while len(cache) > maxsize:
+                        evicted, _ = cache.popitem(last=False)
+                        key_locks.pop(evicted, None)
+
+            return result
+
+        def cache_clear() -> None:
+            with lock:
+                cache.clear()
+                key_locks.clear()
+
+        wrapper.cache_clear = cache_clear
+        return wrapper
+    return decorator
+
 def keyword_fallback(func: Callable):
     """
     Decorator to provide fallback for missing keyword arguments.
@@ -50,22 +117,112 @@ def keyword_fallback(func: Callable):
     Returns:
         Any: Any return value of the decorated function.
     """
-    def wrapper(*args, **kwargs) -> Any:
-        try:
+    try:
+        parameters = inspect.signature(func).parameters.values()
+    except (TypeError, ValueError):
+        parameters = None
+
+    if parameters is not None:
+        # Filter out invalid keyword arguments upfront, based on the signature
+        accepts_var_kw = any(p.kind is p.VAR_KEYWORD for p in parameters)
+        allowed = {
+            p.name for p in parameters
+            if p.kind in (p.POSITIONAL_OR_KEYWORD, p.KEYWORD_ONLY)
+        }
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs) -> Any:
+            if not accepts_var_kw:
+                for arg in kwargs.keys() - allowed:
+                    general_logger.warning(
+                        f"Invalid keyword argument: {arg} - skipping it."
+                    )
+                    del kwargs[arg]
             return func(*args, **kwargs)
-        except TypeError as e:
-            msg = e.args[0]
-            if 'keyword argument' in msg:
-                arg = msg.split('keyword argument ')[1].split(' ')[0]
-                arg = re.sub(r"'([^']*)'", r"\1", arg)
+
+        return wrapper
+
+    # No signature available (e.g. some builtins) - rely on the raised errors
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs) -> Any:
+        while True:
+            try:
+                return func(*args, **kwargs)
+            except TypeError as e:
+                match = _EXTRACT_KW.search(str(e))
+                if match is None or match.group(1) not in kwargs:
+                    raise
+                arg = match.group(1)
                 general_logger.warning(
                     f"Invalid keyword argument: {arg} - retrying without it."
                 )
                 kwargs.pop(arg)
-                return keyword_fallback(func)(*args, **kwargs)
-            raise
     return wrapper
 
+def _prompt(message: str) -> str:
+    """
+    Prompt the user with a message formatted as a question.
+    """
+    if not message.strip().endswith(':'):
+        message += ':'
+    if not message.endswith('\n'):
+        message += '\n'
+    return input(message)
+
+def _validate_int(value: str, ranges: Optional[Tuple[int, int]] = None) -> int:
+    """
+    Convert user input to an integer and check if it fits the given ranges.
+
+    Raises:
+        ValueError: If the input is not a number or is out of ranges.
+    """
+    if not value.isdigit():
+        raise ValueError('Invalid input. Please enter a number.')
+    result = int(value)
+    if ranges and not ranges[0] <= result <= ranges[1]:
+        raise ValueError(f'Invalid input. Please enter a number between {ranges[0]} and {ranges[1]}.')
+    return result
+
+def _in_range(values, low, high, out):
+    """
+    Range check kernel for `batch_validate_ints`, compiled with numba if available.
+    """
+    for i in range(values.shape[0]):
+        out[i] = low <= values[i] <= high
+    return out
+
+@functools.lru_cache(maxsize=None)
+def _compiled_in_range() -> Optional[Callable]:
+    """
+    Compile the range check kernel on first use, so that importing this module stays cheap.
+    """
+    try:
+        from numba import njit
+    except ImportError:
+        return None
+    return njit(cache=True)(_in_range)
+
+def batch_validate_ints(values: Iterable[int], low: int, high: int) -> "np.ndarray":
+    """
+    Check which of the given integers lie within the ranges. Meant for validating
+    many collected inputs at once, e.g. ratings read from a file.
+
+    Args:
+        values (Iterable[int]): Integers to validate.
+        low (int): Lower bound (inclusive).
+        high (int): Upper bound (inclusive).
+
+    Returns:
+        np.ndarray: Boolean mask of the values that lie within the ranges.
+    """
+    import numpy as np
+
+    values = np.ascontiguousarray(values, dtype=np.int64)
+    kernel = _compiled_in_range()
+    if kernel is None:
+        return (values >= low) & (values <= high)
+    return kernel(values, low, high, np.empty(values.shape[0], dtype=np.bool_))
+
 def request_user_input(
         message: str,
         response_type: type,
@@ -77,22 +234,14 @@ def request_user_input(
     Returns:
         str: User input.
     """
-    if not message.strip().endswith(':'):
-        message += ':'
-    if not message.endswith('\n'):
-        message += '\n'
-
-    result = input(message)
+    result = _prompt(message)
 
     if response_type is int:
-        while not result.isdigit():
-            print('Invalid input. Please enter a number.')
-            result = input(message)
-        if ranges:
-            result = int(result)
-            while not ranges[0] <= result <= ranges[1]:
-                print(f'Invalid input. Please enter a number between {ranges[0]} and {ranges[1]}.')
-                result = input(message)
-        return int(result)
+        while True:
+            try:
+                return _validate_int(result, ranges)
+            except ValueError as e:
+                print(e)
+                result = _prompt(message)
     
     return result
@@ -0,0 +1,78 @@
+"""
+Build script freezing the lazy import data of a package.
+
+`LazyModule` flattens the import structure of a package on every interpreter start.
+This script does the flattening once and writes the result as plain literals into
+the `_lazy_data.py` module of the package, which `LazyModule` then loads instead.
+The generated module is keyed by a hash of the import structure, so stale data is
+ignored and `LazyModule` falls back to building the data at runtime.
+
+Run it after changing `_import_structure` of the package:
+
+    python -m universa.utils.freeze_imports [package]
+"""
+import os
+import sys
+import pprint
+import argparse
+import importlib
+import py_compile
+
+from .imports import _flatten, structure_key
+
+
+_TEMPLATE = '''"""
+Lazy import data of `{package}`, generated by `universa.utils.freeze_imports`. Do not edit.
+"""
+
+STRUCTURE_KEY = {key!r}
+
+MODULES = {modules}
+
+ALL_NAMES = {all_names}
+
+CLASS_TO_MODULE = {class_to_module}
+'''
+
+
+def freeze_imports(package: str = "universa") -> str:
+    """
+    Generate the `_lazy_data.py` module for the given package.
+
+    Args:
+        package (str): Name of the package using `LazyModule`.
+
+    Returns:
+        str: Path of the generated module.
+    """
+    module = importlib.import_module(package)
+    import_structure = module._import_structure
+
+    class_to_module, names = _flatten(import_structure)
+    source = _TEMPLATE.format(
+        package=package,
+        key=structure_key(import_structure),
+        modules=pprint.pformat(sorted(import_structure.keys())),
+        all_names=pprint.pformat(sorted(names)),
+        class_to_module=pprint.pformat(class_to_module),
+    )
+
+    path = os.path.join(os.path.dirname(module.__file__), "_lazy_data.py")
+    with open(path, "w") as data_file:
+        data_file.write(source)
+
+    # Compile right away, so the first import doesn't have to
+    py_compile.compile(path, doraise=True)
+    return path
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Freeze the lazy import data of a package.")
+    parser.add_argument("package", nargs="?", default="universa", help="Name of the package to freeze.")
+    args = parser.parse_args()
+
+    sys.stdout.write(f"Written {freeze_imports(args.package)}\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,14 @@
 import os
 import sys
-import pkgutil
+import pickle
+import hashlib
+import functools
+import itertools
 import importlib
+import importlib.util
 from types import ModuleType
-from typing import Any, Iterable, List, Optional
+from collections import deque
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
 import importlib
 import importlib.metadata as importlib_metadata
@@ -13,6 +18,9 @@ from .logs import get_logger
 
 import_logger = get_logger("Import Utility")
 
+# Top level package, resolved on the first `import_class` call
+_universa: Optional[ModuleType] = None
+
 
 def get_parent_path(path: str, levels: int = 1) -> str:
     """
@@ -29,16 +37,38 @@ def get_parent_path(path: str, levels: int = 1) -> str:
         path = os.path.dirname(path)
     return os.path.abspath(path)
 
+@functools.lru_cache(maxsize=None)
 def import_class(class_name: str) -> Any:
     """
     Import a class by name in the wild. This is possible
     thanks to LazyModule used for lazily importing all the modules.
     """
-    return getattr(importlib.import_module("universa"), class_name)
+    global _universa
+    if _universa is None:
+        _universa = sys.modules.get("universa") or importlib.import_module("universa")
+    return getattr(_universa, class_name)
 
+@functools.lru_cache(maxsize=None)
 def check_import(package: str) -> bool:
     """
-    Check if a package is available.
+    Check if a package is importable. Only the import system finders are consulted,
+    so no distribution metadata is read.
+    """
+    try:
+        if importlib.util.find_spec(package) is not None:
+            return True
+    except (ImportError, ValueError):
+        # Parent package of a dotted name is missing or the module has no spec
+        pass
+
+    import_logger.error(f"Package {package} not found.")
+    return False
+
+@functools.lru_cache(maxsize=None)
+def check_distribution(package: str) -> bool:
+    """
+    Check if a distribution of the package is installed. Unlike `check_import`,
+    this reads the installed distribution metadata, so the result is memoized.
     """
     try:
         importlib_metadata.version(package)
@@ -47,42 +77,45 @@ def check_import(package: str) -> bool:
         import_logger.error(f"Package {package} not found.")
         return False
 
-def build_all_paths(structure, current_path: Optional[list] = None, result: Optional[dict] = None):
+def build_all_paths(structure, current_path: Optional[Iterable[str]] = None, result: Optional[dict] = None):
     """
     Recursively build a dictionary of all paths from a nested dictionary.
+    A single path deque is mutated during the walk instead of copying it per level.
     """
     if result is None:
         result = {}
-    if current_path is None:
-        current_path = []
+    if not isinstance(current_path, deque):
+        current_path = deque(current_path or ())
 
     for key, value in structure.items():
+        current_path.append(key)
         if isinstance(value, dict):
-            build_all_paths(value, current_path + [key], result)
+            build_all_paths(value, current_path, result)
         else:
-            result[key] = current_path
-            for item in value:
-                result[item] = current_path + [key]
+            path = list(current_path)
+            result[key] = path[:-1]
+            result.update(zip(value, itertools.repeat(path)))
+        current_path.pop()
     return result
 
-def build_top_paths(structure: dict, current_path: Optional[str] = None):
+def build_top_paths(structure: dict, current_path: Optional[str] = None) -> Iterator[str]:
     """
-    Recursively build a dictionary of all possible paths for given nested dictionary.
+    Lazily yield all possible paths for given nested dictionary. The structure is walked
+    with an explicit stack of iterators, so paths come out in the same, depth-first order
+    as in the nested dictionary.
     """
-    paths = []
-    for key, value in structure.items():
-        if isinstance(value, dict):
-            for sub_path in build_top_paths(value, key):
-                paths.append(f"{sub_path}")
-        else:
+    stack = [(iter(structure.items()), current_path)]
+    while stack:
+        items, prefix = stack[-1]
+        for key, value in items:
+            path = key if prefix is None else ".".join((prefix, key))
+            if isinstance(value, dict):
+                stack.append((iter(value.items()), path))
+                break
             for item in value:
-                paths.append(
-                    f"{key}.{item}"
-                    if current_path is None
-                    else f"{current_path}.{key}.{item}"
-                )
-
-    return paths
+                yield ".".join((path, item))
+        else:
+            stack.pop()
 
 def get_all_attributes(structure, attrs=None):
     """
@@ -101,21 +134,82 @@ def get_all_attributes(structure, attrs=None):
 
     return list(set(attrs))
 
-def import_specific_modules(module_addresses: List[str]) -> None:
+def _flatten(structure: dict) -> Tuple[Dict[str, str], Set[str]]:
+    """
+    Flatten the nested import structure in a single iterative pass.
+
+    Returns:
+        Tuple[Dict[str, str], Set[str]]: Mapping of every name to its dotted module path
+            (as used by `build_all_paths`, but pre-joined) and the set of all names.
+    """
+    class_to_module: Dict[str, str] = {}
+    names: Set[str] = set()
+
+    stack = deque([(structure, "")])
+    while stack:
+        subtree, prefix = stack.pop()
+        for key, value in subtree.items():
+            names.add(key)
+            if isinstance(value, dict):
+                stack.append((value, f"{prefix}.{key}" if prefix else key))
+            else:
+                module = f"{prefix}.{key}" if prefix else key
+                class_to_module[key] = prefix
+                for item in value:
+                    class_to_module[item] = module
+                names.update(value)
+
+    return class_to_module, names
+
+def import_specific_modules(module_addresses: Iterable[str]) -> None:
     """
     Dynamically imports a list of modules from the list of modules addresses.
     If a module is already imported, it is skipped.
 
+    Setting the `UNIVERSA_PARALLEL_IMPORT=1` environment variable imports the missing modules
+    in a small thread pool. Only a cold start benefits from it, as reading the sources and
+    bytecode from disk overlaps, while the import itself is still serialized by the import lock.
+    Parallel imports may surface circular imports that go unnoticed when importing one by one.
+
     Args:
-        module_addresses (List[str]): A list of address of modules to be imported.
+        module_addresses (Iterable[str]): Addresses of modules to be imported.
 
     Returns:
         None
     """
-    for address in module_addresses:
-        if address in sys.modules:
-            continue
-        importlib.import_module(address)
+    # Local bindings avoid repeated global and attribute lookups in the loop
+    modules = sys.modules
+    import_module = importlib.import_module
+
+    missing = [address for address in module_addresses if address not in modules]
+    if len(missing) > 1 and os.environ.get("UNIVERSA_PARALLEL_IMPORT") == "1":
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=min(8, len(missing))) as executor:
+            list(executor.map(import_module, missing))
+        return
+
+    for address in missing:
+        import_module(address)
+
+@functools.lru_cache(maxsize=None)
+def _list_module_addresses(directory: str) -> Tuple[str, ...]:
+    """
+    List addresses of all modules and packages inside a directory. The listing is
+    done in a single directory scan and memoized per directory.
+    """
+    package = directory.replace("/", ".") + "."
+    module_addresses = []
+    for entry in os.scandir(directory):
+        name = entry.name
+        if entry.is_file():
+            if name.endswith(".py") and name != "__init__.py":
+                module_addresses.append(package + name[:-3])
+        elif entry.is_dir() and os.path.isfile(os.path.join(entry.path, "__init__.py")):
+            module_addresses.append(package + name)
+
+    # Keep the same, sorted order as pkgutil.iter_modules
+    return tuple(sorted(module_addresses))
 
 def import_modules_from_directory(directory: str) -> List[str]:
     """
@@ -127,10 +221,10 @@ def import_modules_from_directory(directory: str) -> List[str]:
     Returns:
         List[str]: A list of module addresses that were imported.
     """
-    module_addresses = []
-    for module_info in pkgutil.iter_modules([directory]):
-        module_address = directory.replace("/", ".") + "." + module_info.name
-        module_addresses.append(module_address)
+    try:
+        module_addresses = list(_list_module_addresses(directory))
+    except OSError:
+        module_addresses = []
 
     if len(module_addresses) == 0:
         raise ModuleNotFoundError(
@@ -139,6 +233,75 @@ def import_modules_from_directory(directory: str) -> List[str]:
     import_specific_modules(module_addresses)
     return module_addresses
 
+def structure_key(import_structure: Dict[str, Any]) -> str:
+    """
+    Get a short hash identifying the given import structure.
+    """
+    return hashlib.blake2b(repr(import_structure).encode()).hexdigest()[:16]
+
+def _structure_cache_path(module_file: str, import_structure: Dict[str, Any]) -> str:
+    """
+    Get the path of the cached lazy module artifacts for the given import structure.
+    The cache is keyed by the import structure and the interpreter version.
+    """
+    key = hashlib.blake2b(
+        (repr(import_structure) + repr(tuple(sys.version_info))).encode()
+    ).hexdigest()[:16]
+    return os.path.join(os.path.dirname(module_file), "__pycache__", f"lazymod.{key}.pkl")
+
+def _load_frozen_structure(name: str, import_structure: Dict[str, Any]) -> Optional[Tuple[Dict[str, str], Set[str], List[str]]]:
+    """
+    Load the lazy module artifacts frozen into the generated `_lazy_data` module of the package,
+    see `universa.utils.freeze_imports`. Returns None if the module is missing or out of date.
+    """
+    try:
+        data = importlib.import_module(f"{name}._lazy_data")
+    except ImportError:
+        return None
+
+    if getattr(data, "STRUCTURE_KEY", None) != structure_key(import_structure):
+        import_logger.debug("Frozen import data of %s is out of date, ignoring it.", name)
+        return None
+
+    return dict(data.CLASS_TO_MODULE), set(data.MODULES), list(data.ALL_NAMES)
+
+
+def _load_structure(module_file: str, import_structure: Dict[str, Any]) -> Tuple[Dict[str, str], Set[str], List[str]]:
+    """
+    Load the lazy module artifacts from the cache, or build and cache them if missing.
+    Read-only installs fall back to building the artifacts on every start.
+    """
+    cache_path = _structure_cache_path(module_file, import_structure)
+    try:
+        with open(cache_path, "rb") as cache_file:
+            return pickle.load(cache_file)
+    except (OSError, pickle.UnpicklingError, EOFError, ValueError, TypeError):
+        pass
+
+    class_to_module, _all = _flatten(import_structure)
+    artifacts = (class_to_module, set(import_structure.keys()), list(_all))
+
+    try:
+        import tempfile
+
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(cache_path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as tmp_file:
+                pickle.dump(artifacts, tmp_file, protocol=pickle.HIGHEST_PROTOCOL)
+            # mkstemp creates the file readable by its owner only, the cache is shared by all users of the install
+            os.chmod(tmp_path, 0o644)
+            # Atomic, so concurrent interpreters never see a partially written cache
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            os.unlink(tmp_path)
+            raise
+    except OSError as e:
+        import_logger.debug("Could not write the lazy module cache %s: %s", cache_path, e)
+
+    return artifacts
+
+
 class LazyModule(ModuleType):
     """
     Module class that surfaces all objects but only performs associated imports when the objects are requested.
@@ -154,16 +317,12 @@ class LazyModule(ModuleType):
     ):
         super().__init__(name)
 
-        # Create all possible imports
-        self._class_to_module = build_all_paths(import_structure)
-
-        # Create all top level modules
-        self._modules = set(import_structure.keys())
-
-        # Needed for autocompletion in an IDE
-        self.__all__ = get_all_attributes(
-            import_structure
-        )  # create all attributes of given imports
+        # Create all possible imports (with already joined module paths), all top level modules
+        # and all attributes of given imports, loading them from the frozen data or the cache when possible
+        self._class_to_module, self._modules, self.__all__ = (
+            _load_frozen_structure(name, import_structure)
+            or _load_structure(module_file, import_structure)
+        )
         self.__file__ = module_file
         self.__spec__ = module_spec
         self.__path__ = [os.path.dirname(module_file)]
@@ -171,6 +330,14 @@ class LazyModule(ModuleType):
         self._name = name
         self._import_structure = import_structure
 
+        # Single lookup table for `__getattr__`, later entries take precedence
+        # in the same order as the original checks: objects, modules, classes
+        self._resolve = {
+            **{attr: ("cls", module) for attr, module in self._class_to_module.items()},
+            **{attr: ("mod", attr) for attr in self._modules},
+            **{attr: ("obj", value) for attr, value in self._objects.items()},
+        }
+
     def __dir__(self):
         """
         The elements of self.__all__ that are submodules may or may not be in the dir already, depending on whether
@@ -189,21 +356,21 @@ class LazyModule(ModuleType):
         """
         Method used when import from.
         """
-        if name in self._objects:
-            return self._objects[name]
-
-        if name in self._modules:
-            value = self._get_module(name)
+        hit = self._resolve.get(name)
+        if hit is None:
+            raise AttributeError(f"module {self.__name__} has no attribute {name}")
 
-        elif name in self._class_to_module.keys():
-            # Get the module and then create the whole import path
-            _modules = self._class_to_module[name]
-            module = self._get_module(".".join(_modules))
-            value = getattr(module, name)
+        kind, payload = hit
+        if kind == "obj":
+            return payload
 
+        if kind == "mod":
+            value = self._get_module(payload)
         else:
-            raise AttributeError(f"module {self.__name__} has no attribute {name}")
+            # Get the module from its whole import path
+            value = getattr(self._get_module(payload), name)
 
+        # Later accesses find the value in the module dict and skip `__getattr__`
         setattr(self, name, value)
 
         return value
@@ -1,7 +1,42 @@
 import logging
 import os
 
-from colorlog import ColoredFormatter
+
+LOGGING_HANDLER = None
+
+
+class _ColoredStreamHandler(logging.StreamHandler):
+    """
+    Console handler that builds its colored formatter on the first formatted record,
+    so colorlog is only imported once something is actually logged.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        if self.formatter is None:
+            self.setFormatter(_colored_formatter())
+        return super().format(record)
+
+
+def _colored_formatter() -> logging.Formatter:
+    """
+    Create the colored formatter used by the console logger.
+    """
+    from colorlog import ColoredFormatter
+
+    return ColoredFormatter(
+        "%(log_color)s%(asctime)s %(levelname)-8s %(message)s",
+        datefmt='%Y-%m-%d %H:%M:%S',
+        reset=True,
+        log_colors={
+            'DEBUG': 'cyan',
+            'INFO': 'blue',
+            'WARNING': 'yellow',
+            'ERROR': 'red',
+            'CRITICAL': 'red,bg_white'
+        },
+        secondary_log_colors={},
+        style='%'
+    )
 
 
 def config_logging(level: int = logging.INFO) -> logging.StreamHandler:
@@ -21,35 +56,32 @@ def config_logging(level: int = logging.INFO) -> logging.StreamHandler:
         filemode='w'
     )
 
-    # Add console logger
-    console = logging.StreamHandler()
+    # Add console logger, its colored formatter is created on the first record
+    console = _ColoredStreamHandler()
     console.setLevel(level)
-    formatter = ColoredFormatter(
-        "%(log_color)s%(asctime)s %(levelname)-8s %(message)s",
-        datefmt='%Y-%m-%d %H:%M:%S',
-        reset=True,
-        log_colors={
-            'DEBUG': 'cyan',
-            'INFO': 'blue',
-            'WARNING': 'yellow',
-            'ERROR': 'red',
-            'CRITICAL': 'red,bg_white'
-        },
-        secondary_log_colors={},
-        style='%'
-    )
-    console.setFormatter(formatter)
     
     return console
 
-LOGGING_HANDLER = config_logging()
+def _get_handler() -> logging.StreamHandler:
+    """
+    Get the shared console handler, configuring logging on the first call.
+    """
+    global LOGGING_HANDLER
+    if LOGGING_HANDLER is None:
+        LOGGING_HANDLER = config_logging()
+    return LOGGING_HANDLER
 
 def get_logger(name: str) -> logging.Logger:
     """
     Get basic logger with custom configuration.
     """
     logger = logging.getLogger(name)
-    logger.addHandler(LOGGING_HANDLER)
+    handler = _get_handler()
+    # Loggers are shared by name, so attach the handler only once
+    if not any(h is handler for h in logger.handlers):
+        logger.addHandler(handler)
+        # The console handler already emits the record, the root logger shouldn't repeat it
+        logger.propagate = False
     
     return logger
 
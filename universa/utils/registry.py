@@ -1,43 +1,58 @@
 import uuid
 
 
+MISSING = object()
+
+
 class ItemExists(Exception):
     __name__ = "ItemExists"
     __desc__ = "Item `{}` already exists in the registry with value `{}`."
 
     def __init__(self, key, value, **kwargs) -> None:
-        desc = self.__desc__.format(key, value)
-        super().__init__(*(desc, ), **kwargs)
+        # The message is formatted only when the exception is displayed
+        self.key = key
+        self.value = value
+        super().__init__(*(key, value), **kwargs)
+
+    def __str__(self) -> str:
+        return self.__desc__.format(self.key, self.value)
 
 class ItemNotFound(Exception):
     __name__ = "ItemNotFound"
     __desc__ = "Item `{}` does not exist in the registry."
 
     def __init__(self, key, **kwargs) -> None:
-        desc = self.__desc__.format(key)
-        super().__init__(*(desc, ), **kwargs)
+        self.key = key
+        super().__init__(*(key, ), **kwargs)
+
+    def __str__(self) -> str:
+        return self.__desc__.format(self.key)
 
 class Registry:
     """
     Base class for registers, such as object registry.
     """
+    # The items are kept in a single dict, so instances need no attribute dictionary
+    __slots__ = ("registry",)
+
     def __init__(self):
         self.registry = {}
 
     def register(self, key, value):
-        if key not in self:
-            self[key] = value
-        raise ItemExists(
-            key, self[key]
-        )
+        if key in self.registry:
+            raise ItemExists(
+                key, self.registry[key]
+            )
+        self.registry[key] = value
         
     def unregister(self, key):
         del self[key]
         
     def __getitem__(self, key):
-        if key not in self.registry:
+        value = self.registry.get(key, MISSING)
+        if value is MISSING:
             raise ItemNotFound(key)
-        return self.registry.get(key)
+        return value
     
     def __setitem__(self, key, value):
         self.registry[key] = value
@@ -64,4 +79,6 @@ def generate_id(id_step: int = 1) -> str:
     """
     Generate a unique ID.
     """
-    return str(uuid.uuid4())[::max(1, id_step)]
+    # Hex form skips formatting the dashed string representation
+    uid = uuid.uuid4().hex
+    return uid if id_step <= 1 else uid[::id_step]